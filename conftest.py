@@ -5,7 +5,8 @@ def pytest_collection_modifyitems(items, config):
     """Remove a certain class to run."""
     deselected = []
     for item in items:
-        if item.cls.__name__ == 'BaseAPICrudTestCase':
+        # item.cls is None for function-style (non-unittest) test items.
+        if getattr(item.cls, '__name__', None) == 'BaseAPICrudTestCase':
             deselected.append(item)
     config.hook.pytest_deselected(items=deselected)
     items[:] = [item for item in items if item not in deselected]
@@ -1,9 +1,9 @@
 # coding=utf-8
 """Test cases that copy content units."""
 import os
-import time
 import unittest
-from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 import pytest
 from packaging.version import Version
@@ -38,11 +38,41 @@ from pulp_2_tests.tests.rpm.utils import set_up_module as setUpModule  # pylint:
 
 _PATH = '/var/lib/pulp/published/yum/https/repos/'
 
+_PRODUCTID_XPATH = "{{{namespace}}}data[@type='productid']".format(
+    namespace=RPM_NAMESPACES['metadata/repo']
+)
+
+
+@lru_cache(maxsize=None)
+def _cfg():
+    """Return a cached Pulp Smash configuration object."""
+    return config.get_config()
+
+
+@lru_cache(maxsize=None)
+def _bug_is_fixed(issue_id, pulp_version):
+    """Return a cached ``selectors.bug_is_fixed`` result."""
+    return selectors.bug_is_fixed(issue_id, pulp_version)
+
+
+@lru_cache(maxsize=None)
+def _fetch_rpm(url):
+    """Download an RPM once and reuse its bytes across tests."""
+    return utils.http_get(url)
+
 
 @pytest.mark.recursive_conservative
 class CopyErrataRecursiveTestCase(unittest.TestCase):
     """Test that recursive copy of erratas copies RPM packages."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create class-wide variables."""
+        cls.cfg = _cfg()
+        if not _bug_is_fixed(3004, cls.cfg.pulp_version):
+            raise unittest.SkipTest('https://pulp.plan.io/issues/3004')
+        cls.client = api.Client(cls.cfg, api.json_handler)
+
     def test_all(self):
         """Test that recursive copy of erratas copies RPM packages.
 
@@ -60,12 +90,9 @@ class CopyErrataRecursiveTestCase(unittest.TestCase):
            ``erratum``.
         4. Assert that RPM packages were copied.
         """
-        cfg = config.get_config()
-        if not selectors.bug_is_fixed(3004, cfg.pulp_version):
-            self.skipTest('https://pulp.plan.io/issues/3004')
-
+        cfg = self.cfg
         repos = []
-        client = api.Client(cfg, api.json_handler)
+        client = self.client
         body = gen_repo()
         body['importer_config']['feed'] = RPM_UPDATED_INFO_FEED_URL
         body['distributors'] = [gen_distributor()]
@@ -79,7 +106,7 @@ class CopyErrataRecursiveTestCase(unittest.TestCase):
 
         # Copy data to second repository.
         client.post(
-            urljoin(repos[1]['_href'], 'actions/associate/'),
+            f"{repos[1]['_href']}actions/associate/",
             {
                 'source_repo_id': repos[0]['id'],
                 'override_config': {'recursive': True},
@@ -95,6 +122,14 @@ class CopyErrataRecursiveTestCase(unittest.TestCase):
 class MtimeTestCase(unittest.TestCase):
     """Test whether copied files retain their original mtime."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create class-wide variables."""
+        cls.cfg = _cfg()
+        if not _bug_is_fixed(2783, cls.cfg.pulp_version):
+            raise unittest.SkipTest('https://pulp.plan.io/issues/2783')
+        cls.client = api.Client(cls.cfg, api.json_handler)
+
     def test_all(self):
         """Test whether copied files retain their original mtime.
 
@@ -112,12 +147,9 @@ class MtimeTestCase(unittest.TestCase):
         4. Get the ``mtime`` of the sqlite files again. Verify that the mtimes
            are the same.
         """
-        cfg = config.get_config()
-        if not selectors.bug_is_fixed(2783, cfg.pulp_version):
-            self.skipTest('https://pulp.plan.io/issues/2783')
-
+        cfg = self.cfg
         # Create, sync and publish a repository.
-        client = api.Client(cfg, api.json_handler)
+        client = self.client
         body = gen_repo()
         body['importer_config']['feed'] = RPM_UNSIGNED_FEED_URL
         body['distributors'] = [gen_distributor()]
@@ -131,23 +163,25 @@ class MtimeTestCase(unittest.TestCase):
         # Get the mtime of the sqlite files.
         cli_client = cli.Client(cfg, cli.echo_handler)
         cmd = '' if cli.is_root(cfg) else 'sudo '
-        cmd += "bash -c \"stat --format %Y '{}'/*\"".format(
+        # %.Y gives sub-second precision, so there is no need to sleep
+        # between snapshots to let the mtime granularity advance.
+        cmd += "bash -c \"stat --format %.Y '{}'/*\"".format(
             os.path.join(
                 _PATH, repo['distributors'][0]['config']['relative_url'], 'repodata'
             )
         )
-        # machine.session is used here to keep SSH session open
-        mtimes_pre = cli_client.machine.session().run(cmd)[1].strip().split().sort()
+        # One session is kept open and reused for both stat calls, instead
+        # of negotiating a new SSH channel for each one.
+        session = cli_client.machine.session()
+        mtimes_pre = sorted(session.run(cmd)[1].strip().split())
 
         # Upload to the repo, and sync it.
-        rpm = utils.http_get(RPM_SIGNED_URL)
+        rpm = _fetch_rpm(RPM_SIGNED_URL)
         upload_import_unit(cfg, rpm, {'unit_type_id': 'rpm'}, repo)
         sync_repo(cfg, repo)
 
         # Get the mtime of the sqlite files again.
-        time.sleep(1)
-        # machine.session is used here to keep SSH session open
-        mtimes_post = cli_client.machine.session().run(cmd)[1].strip().split().sort()
+        mtimes_post = sorted(session.run(cmd)[1].strip().split())
         self.assertEqual(mtimes_pre, mtimes_post)
 
 
@@ -155,6 +189,12 @@ class MtimeTestCase(unittest.TestCase):
 class CopyYumMetadataFileTestCase(unittest.TestCase):
     """Test the copy of metadata units between repos."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create class-wide variables."""
+        cls.cfg = _cfg()
+        cls.client = api.Client(cls.cfg, api.json_handler)
+
     def test_all(self):
         """Test whether metadata copied between repos are independent.
 
@@ -176,8 +216,8 @@ class CopyYumMetadataFileTestCase(unittest.TestCase):
         5. Publish repo 2 again and check whether the metadata is
            present in the second repo still.
         """
-        cfg = config.get_config()
-        client = api.Client(cfg, api.json_handler)
+        cfg = self.cfg
+        client = self.client
         body = gen_repo(
             importer_config={'feed': RPM_YUM_METADATA_FILE},
             distributors=[gen_distributor()],
@@ -185,17 +225,16 @@ class CopyYumMetadataFileTestCase(unittest.TestCase):
         repo_1 = client.post(REPOSITORY_PATH, body)
         self.addCleanup(client.delete, repo_1['_href'])
         sync_repo(cfg, repo_1)
-        repo_1 = client.get(repo_1['_href'], params={'details': True})
 
         # Create a second repository.
         body = gen_repo(distributors=[gen_distributor()])
         repo_2 = client.post(REPOSITORY_PATH, body)
-        repo_2 = client.get(repo_2['_href'], params={'details': True})
         self.addCleanup(client.delete, repo_2['_href'])
+        repo_2 = client.get(repo_2['_href'], params={'details': True})
 
         # Copy data to second repository.
         client.post(
-            urljoin(repo_2['_href'], 'actions/associate/'),
+            f"{repo_2['_href']}actions/associate/",
             {
                 'source_repo_id': repo_1['id'],
                 'override_config': {'recursive': True},
@@ -207,7 +246,7 @@ class CopyYumMetadataFileTestCase(unittest.TestCase):
         publish_repo(cfg, repo_2)
         # Removing metadata from repo 1 and deleting orphans.
         client.post(
-            urljoin(repo_1['_href'], 'actions/unassociate/'),
+            f"{repo_1['_href']}actions/unassociate/",
             {'criteria': {'filters': {}}},
         )
         repo_1 = client.get(repo_1['_href'], params={'details': True})
@@ -218,12 +257,7 @@ class CopyYumMetadataFileTestCase(unittest.TestCase):
 
         # retrieve repodata of the published repo
         xml_element = get_repodata_repomd_xml(cfg, repo_2['distributors'][0])
-        xpath = '{{{namespace}}}data'.format(namespace=RPM_NAMESPACES['metadata/repo'])
-        yum_meta_data_element = [
-            element
-            for element in xml_element.findall(xpath)
-            if element.attrib['type'] == 'productid'
-        ]
+        yum_meta_data_element = xml_element.findall(_PRODUCTID_XPATH)
         self.assertNotIn('yum_repo_metadata_file', repo_1['content_unit_counts'])
         self.assertEqual(repo_2['content_unit_counts']['yum_repo_metadata_file'], 1)
         self.assertGreater(len(yum_meta_data_element), 0)
@@ -253,13 +287,42 @@ class CopyConservativeTestCase(unittest.TestCase):
     * `Pulp #4543 <https://pulp.plan.io/issues/4543>`_
     """
 
+    _CHIMP_CRITERIA = {
+        'filters': {'unit': {'name': 'chimpanzee'}},
+        'type_ids': ['rpm'],
+    }
+
     @classmethod
     def setUpClass(cls):
-        """Create class-wide variables."""
-        cls.cfg = config.get_config()
+        """Create class-wide variables and a synced source repository.
+
+        The source repository's content is the same for every test
+        variant: only the destination repository differs. Create and sync
+        it once here instead of once per test.
+        """
+        cls.cfg = _cfg()
         if cls.cfg.pulp_version < Version('2.18.1'):
             raise unittest.SkipTest('This test requires Pulp 2.18.1 or newer.')
         cls.client = api.Client(cls.cfg, api.json_handler)
+        cls._cleanup_hrefs = []
+        body = gen_repo(
+            importer_config={'feed': RPM_UNSIGNED_FEED_URL},
+            distributors=[gen_distributor()],
+        )
+        cls.source_repo = cls.client.post(REPOSITORY_PATH, body)
+        cls._cleanup_hrefs.append(cls.source_repo['_href'])
+        sync_repo(cls.cfg, cls.source_repo)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Delete all repositories created by the class, then orphans.
+
+        The DELETEs are independent, so they are issued in parallel
+        rather than as one sequential round-trip per repository.
+        """
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(cls.client.delete, cls._cleanup_hrefs))
+        cls.client.delete(ORPHANS_PATH)
 
     def test_recursive_noconservative_nodependency(self):
         """Recursive, non-conservative, and no old dependency.
@@ -274,19 +337,7 @@ class CopyConservativeTestCase(unittest.TestCase):
            and the walrus package version is equal to ``5.21``.
         """
         repo = self.copy_units(True, False, False)
-        versions = [
-            unit['metadata']['version']
-            for unit in search_units(self.cfg, repo, {'type_ids': ['rpm']})
-            if unit['metadata']['name'] == 'walrus'
-        ]
-        self.assertEqual(len(versions), 1, versions)
-        self.assertEqual(versions[0], '5.21', versions)
-
-        dst_unit_ids = [
-            unit['metadata']['name']
-            for unit in search_units(self.cfg, repo, {'type_ids': ['rpm']})
-        ]
-        self.assertEqual(len(dst_unit_ids), 5, dst_unit_ids)
+        self.check_copy(repo, 5, ['5.21'])
 
     def test_recursive_conservative_nodependency(self):
         """Recursive, conservative, and no old dependency.
@@ -301,19 +352,7 @@ class CopyConservativeTestCase(unittest.TestCase):
            and the walrus package version is equal to ``5.21``.
         """
         repo = self.copy_units(True, True, False)
-        versions = [
-            unit['metadata']['version']
-            for unit in search_units(self.cfg, repo, {'type_ids': ['rpm']})
-            if unit['metadata']['name'] == 'walrus'
-        ]
-        self.assertEqual(len(versions), 1, versions)
-        self.assertEqual(versions[0], '5.21', versions)
-
-        dst_unit_ids = [
-            unit['metadata']['name']
-            for unit in search_units(self.cfg, repo, {'type_ids': ['rpm']})
-        ]
-        self.assertEqual(len(dst_unit_ids), 5, dst_unit_ids)
+        self.check_copy(repo, 5, ['5.21'])
 
     def test_recursive_conservative_dependency(self):
         """Recursive, conservative and with old dependency.
@@ -328,19 +367,7 @@ class CopyConservativeTestCase(unittest.TestCase):
            and the walrus package version is equal to ``0.71``.
         """
         repo = self.copy_units(True, True, True)
-        versions = [
-            unit['metadata']['version']
-            for unit in search_units(self.cfg, repo, {'type_ids': ['rpm']})
-            if unit['metadata']['name'] == 'walrus'
-        ]
-        self.assertEqual(len(versions), 1, versions)
-        self.assertEqual(versions[0], '0.71', versions)
-
-        dst_unit_ids = [
-            unit['metadata']['name']
-            for unit in search_units(self.cfg, repo, {'type_ids': ['rpm']})
-        ]
-        self.assertEqual(len(dst_unit_ids), 5, dst_unit_ids)
+        self.check_copy(repo, 5, ['0.71'])
 
     def test_norecursive_conservative_dependency(self):
         """Non-recursive, conservative, with old dependency.
@@ -355,19 +382,7 @@ class CopyConservativeTestCase(unittest.TestCase):
            and the walrus package version is equal to ``0.71``.
         """
         repo = self.copy_units(False, True, True)
-        versions = [
-            unit['metadata']['version']
-            for unit in search_units(self.cfg, repo, {'type_ids': ['rpm']})
-            if unit['metadata']['name'] == 'walrus'
-        ]
-        self.assertEqual(len(versions), 1, versions)
-        self.assertEqual(versions[0], '0.71', versions)
-
-        dst_unit_ids = [
-            unit['metadata']['name']
-            for unit in search_units(self.cfg, repo, {'type_ids': ['rpm']})
-        ]
-        self.assertEqual(len(dst_unit_ids), 5, dst_unit_ids)
+        self.check_copy(repo, 5, ['0.71'])
 
     def test_norecursive_noconservative_nodependency(self):
         """Non-recursive, non-conservative, and no old dependency.
@@ -381,11 +396,7 @@ class CopyConservativeTestCase(unittest.TestCase):
         2. Assert that total number of RPM of units copied is equal to ``1``.
         """
         repo = self.copy_units(False, False, False)
-        dst_unit_ids = [
-            unit['metadata']['name']
-            for unit in search_units(self.cfg, repo, {'type_ids': ['rpm']})
-        ]
-        self.assertEqual(len(dst_unit_ids), 1, dst_unit_ids)
+        self.check_copy(repo, 1)
 
     def test_recursive_noconservative_dependency(self):
         """Recursive, non-conservative, and ``walrus-0.71`` on B.
@@ -404,60 +415,57 @@ class CopyConservativeTestCase(unittest.TestCase):
         the ``latest`` version of the RPM is also copied.
         """
         repo = self.copy_units(True, False, True)
-        # Versions of modules expected to be returned
-        expected_versions = ['5.21', '0.71']
-        # Search and return RPM packages after copied on B
-        versions = [
-            unit['metadata']['version']
-            for unit in search_units(self.cfg, repo, {'type_ids': ['rpm']})
-            if unit['metadata']['name'] == 'walrus'
-        ]
-        self.assertEqual(len(versions), 2, versions)
-        self.assertEqual(sorted(versions), sorted(expected_versions), versions)
-        dst_unit_ids = [
-            unit['metadata']['name']
-            for unit in search_units(self.cfg, repo, {'type_ids': ['rpm']})
-        ]
         # Expect to find one more unit since old and new version of
         # walrus are now on repo B
-        self.assertEqual(len(dst_unit_ids), 6, dst_unit_ids)
+        self.check_copy(repo, 6, ['5.21', '0.71'])
 
     def copy_units(self, recursive, recursive_conservative, old_dependency):
         """Copy units using ``recursive`` and  ``recursive_conservative``."""
-        repos = []
-        body = gen_repo(
-            importer_config={'feed': RPM_UNSIGNED_FEED_URL},
-            distributors=[gen_distributor()],
-        )
-        repos.append(self.client.post(REPOSITORY_PATH, body))
-        self.addCleanup(self.client.delete, repos[0]['_href'])
-        sync_repo(self.cfg, repos[0])
-        repos.append(self.client.post(REPOSITORY_PATH, gen_repo()))
-        self.addCleanup(self.client.delete, repos[1]['_href'])
+        repo = self.client.post(REPOSITORY_PATH, gen_repo())
+        self._cleanup_hrefs.append(repo['_href'])
 
         # `old_dependency` will import an older version, `0.71` of walrus to
         # the destiny repository.
         if old_dependency:
-            rpm = utils.http_get(RPM_WITH_OLD_VERSION_URL)
-            upload_import_unit(self.cfg, rpm, {'unit_type_id': 'rpm'}, repos[1])
-            units = search_units(self.cfg, repos[1], {'type_ids': ['rpm']})
+            rpm = _fetch_rpm(RPM_WITH_OLD_VERSION_URL)
+            upload_import_unit(self.cfg, rpm, {'unit_type_id': 'rpm'}, repo)
+            units = search_units(self.cfg, repo, {'type_ids': ['rpm']})
             self.assertEqual(len(units), 1, units)
 
         self.client.post(
-            urljoin(repos[1]['_href'], 'actions/associate/'),
+            f"{repo['_href']}actions/associate/",
             {
-                'source_repo_id': repos[0]['id'],
+                'source_repo_id': self.source_repo['id'],
                 'override_config': {
                     'recursive': recursive,
                     'recursive_conservative': recursive_conservative,
                 },
-                'criteria': {
-                    'filters': {'unit': {'name': 'chimpanzee'}},
-                    'type_ids': ['rpm'],
-                },
+                'criteria': self._CHIMP_CRITERIA,
             },
         )
-        return self.client.get(repos[1]['_href'], params={'details': True})
+        return repo
+
+    def check_copy(self, repo, expected_count, expected_versions=None):
+        """Assert on the RPM units copied to the destination repository.
+
+        Verify that ``repo`` holds ``expected_count`` RPM units and, when
+        ``expected_versions`` is given, that the walrus package is present
+        in exactly those versions.
+        """
+        rpms = self._all_rpms(repo)
+        if expected_versions is not None:
+            versions = [
+                unit['metadata']['version']
+                for unit in rpms
+                if unit['metadata']['name'] == 'walrus'
+            ]
+            self.assertCountEqual(versions, expected_versions, versions)
+        dst_unit_ids = [unit['metadata']['name'] for unit in rpms]
+        self.assertEqual(len(dst_unit_ids), expected_count, dst_unit_ids)
+
+    def _all_rpms(self, repo):
+        """Search for all RPM units in a repository with a single call."""
+        return search_units(self.cfg, repo, {'type_ids': ['rpm']})
 
 
 @pytest.mark.recursive_conservative
@@ -483,13 +491,53 @@ class MultipleSourceRepositoriesRecursiveCopyTestCase(unittest.TestCase):
     * `Pulp #5449 <https://pulp.plan.io/issues/5449>`_
     """
 
+    _MODULE_CRITERIA = {
+        'filters': {
+            'unit': {
+                '$and': [
+                    {
+                        'name': MODULE_FIXTURES_PACKAGE_STREAM['name'],
+                        'stream': MODULE_FIXTURES_PACKAGE_STREAM['stream'],
+                    }
+                ]
+            }
+        },
+        'type_ids': ['modulemd'],
+    }
+
+    _ERRATA_CRITERIA = {
+        'filters': {'unit': {'id': MODULE_FIXTURES_ERRATA['errata_id']}},
+        'type_ids': ['erratum'],
+    }
+
     @classmethod
     def setUpClass(cls):
-        """Create class-wide variables."""
-        cls.cfg = config.get_config()
+        """Create class-wide variables and synced source repositories.
+
+        The source repositories are only read from during the copies, so
+        each feed is created and synced just once and shared by all test
+        methods. Both syncs are submitted before either is awaited, so
+        Pulp runs them concurrently server-side.
+        """
+        cls.cfg = _cfg()
         if cls.cfg.pulp_version < Version('2.21'):
             raise unittest.SkipTest('This test requires Pulp 2.21 or newer.')
         cls.client = api.Client(cls.cfg, api.json_handler)
+        cls._cleanup_hrefs = []
+        cls.repo_1 = cls.create_repo(RPM_WITH_MODULES_MODIFIED_FEED_URL)
+        cls.repo_2 = cls.create_repo(RPM_UNSIGNED_MODIFIED_FEED_URL)
+        cls.sync_repos((cls.repo_1, cls.repo_2))
+
+    @classmethod
+    def tearDownClass(cls):
+        """Delete all repositories created by the class, then orphans.
+
+        The DELETEs are independent, so they are issued in parallel
+        rather than as one sequential round-trip per repository.
+        """
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(cls.client.delete, cls._cleanup_hrefs))
+        cls.client.delete(ORPHANS_PATH)
 
     def test_additional_repos_copy_one_destination(self):
         """Multiple source repositories recursive copy - one repo destination.
@@ -497,46 +545,29 @@ class MultipleSourceRepositoriesRecursiveCopyTestCase(unittest.TestCase):
         1. Copy ``walrus - 0.71`` module to repository 3, and all
            the dependencies RPMS should be solved and copied as well.
         """
-        repo_1 = self.create_sync_repo(RPM_WITH_MODULES_MODIFIED_FEED_URL)
-        repo_2 = self.create_sync_repo(RPM_UNSIGNED_MODIFIED_FEED_URL)
-
         repo_3 = self.client.post(REPOSITORY_PATH, gen_repo())
-        self.addCleanup(self.client.delete, repo_3['_href'])
+        self._cleanup_hrefs.append(repo_3['_href'])
 
         self.client.post(
-            urljoin(repo_3['_href'], 'actions/associate/'),
+            f"{repo_3['_href']}actions/associate/",
             {
-                'source_repo_id': repo_1['id'],
+                'source_repo_id': self.repo_1['id'],
                 'override_config': {
                     'recursive_conservative': True,
-                    'additional_repos': {repo_2['id']: repo_3['id']},
-                },
-                'criteria': {
-                    'filters': {
-                        'unit': {
-                            '$and': [
-                                {
-                                    'name': MODULE_FIXTURES_PACKAGE_STREAM['name'],
-                                    'stream': MODULE_FIXTURES_PACKAGE_STREAM['stream'],
-                                }
-                            ]
-                        }
-                    },
-                    'type_ids': ['modulemd'],
+                    'additional_repos': {self.repo_2['id']: repo_3['id']},
                 },
+                'criteria': self._MODULE_CRITERIA,
             },
         )
 
         repo_3 = self.client.get(repo_3['_href'], params={'details': True})
 
-        repo_3_rpms = sorted(
-            [
-                unit['metadata']['filename']
-                for unit in search_units(self.cfg, repo_3, {'type_ids': ['rpm']})
-            ]
-        )
+        repo_3_rpms = [
+            unit['metadata']['filename']
+            for unit in search_units(self.cfg, repo_3, {'type_ids': ['rpm']})
+        ]
 
-        self.assertEqual(repo_3_rpms, RPM_PACKAGES_MULTIPLE_REPOS, repo_3_rpms)
+        self.assertCountEqual(repo_3_rpms, RPM_PACKAGES_MULTIPLE_REPOS)
         self.assertEqual(repo_3['content_unit_counts']['modulemd'], 1, repo_3)
         self.assertEqual(repo_3['content_unit_counts']['modulemd_defaults'], 1, repo_3)
 
@@ -548,62 +579,43 @@ class MultipleSourceRepositoriesRecursiveCopyTestCase(unittest.TestCase):
            The other dependencies present on the repository 2, ``shark``
            and ``stork`` will be copied to the repository 4.
         """
-        repo_1 = self.create_sync_repo(RPM_WITH_MODULES_MODIFIED_FEED_URL)
-        repo_2 = self.create_sync_repo(RPM_UNSIGNED_MODIFIED_FEED_URL)
-
         repo_3 = self.client.post(REPOSITORY_PATH, gen_repo())
-        self.addCleanup(self.client.delete, repo_3['_href'])
+        self._cleanup_hrefs.append(repo_3['_href'])
 
         repo_4 = self.client.post(REPOSITORY_PATH, gen_repo())
-        self.addCleanup(self.client.delete, repo_4['_href'])
+        self._cleanup_hrefs.append(repo_4['_href'])
 
         self.client.post(
-            urljoin(repo_3['_href'], 'actions/associate/'),
+            f"{repo_3['_href']}actions/associate/",
             {
-                'source_repo_id': repo_1['id'],
+                'source_repo_id': self.repo_1['id'],
                 'override_config': {
                     'recursive_conservative': True,
-                    'additional_repos': {repo_2['id']: repo_4['id']},
-                },
-                'criteria': {
-                    'filters': {
-                        'unit': {
-                            '$and': [
-                                {
-                                    'name': MODULE_FIXTURES_PACKAGE_STREAM['name'],
-                                    'stream': MODULE_FIXTURES_PACKAGE_STREAM['stream'],
-                                }
-                            ]
-                        }
-                    },
-                    'type_ids': ['modulemd'],
+                    'additional_repos': {self.repo_2['id']: repo_4['id']},
                 },
+                'criteria': self._MODULE_CRITERIA,
             },
         )
 
         repo_3 = self.client.get(repo_3['_href'], params={'details': True})
         repo_4 = self.client.get(repo_4['_href'], params={'details': True})
 
-        repo_3_rpms = sorted(
-            [
-                unit['metadata']['filename']
-                for unit in search_units(self.cfg, repo_3, {'type_ids': ['rpm']})
-            ]
-        )
+        repo_3_rpms = [
+            unit['metadata']['filename']
+            for unit in search_units(self.cfg, repo_3, {'type_ids': ['rpm']})
+        ]
 
-        repo_4_rpms = sorted(
-            [
-                unit['metadata']['filename']
-                for unit in search_units(self.cfg, repo_4, {'type_ids': ['rpm']})
-            ]
-        )
+        repo_4_rpms = [
+            unit['metadata']['filename']
+            for unit in search_units(self.cfg, repo_4, {'type_ids': ['rpm']})
+        ]
 
         self.assertEqual(repo_3['content_unit_counts']['modulemd'], 1, repo_3)
         self.assertEqual(repo_3['content_unit_counts']['modulemd_defaults'], 1, repo_3)
-        self.assertEqual(repo_3_rpms, RPM_PACKAGES_MULTIPLE_REPOS[-2:], repo_3_rpms)
+        self.assertCountEqual(repo_3_rpms, RPM_PACKAGES_MULTIPLE_REPOS[-2:])
 
         self.assertEqual(len(repo_4['content_unit_counts']), 1, repo_4)
-        self.assertEqual(repo_4_rpms, RPM_PACKAGES_MULTIPLE_REPOS[:-2], repo_4_rpms)
+        self.assertCountEqual(repo_4_rpms, RPM_PACKAGES_MULTIPLE_REPOS[:-2])
 
     def test_additional_repos_errata(self):
         """Copy errata using additional repos as source.
@@ -614,72 +626,78 @@ class MultipleSourceRepositoriesRecursiveCopyTestCase(unittest.TestCase):
         Pulp should copy the errata and solve the dependency chain for
         repository 3.
         """
-        if not selectors.bug_is_fixed(5449, self.cfg.pulp_version):
+        if not _bug_is_fixed(5449, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/5449')
 
-        for _ in range(2):
-            repo_1 = self.create_sync_repo(RPM_WITH_MODULES_MODIFIED_FEED_URL)
-            repo_2 = self.create_sync_repo(RPM_UNSIGNED_MODIFIED_FEED_URL)
-
-            repo_3 = self.client.post(REPOSITORY_PATH, gen_repo())
-            self.addCleanup(self.client.delete, repo_3['_href'])
-
-            self.client.post(
-                urljoin(repo_3['_href'], 'actions/associate/'),
-                {
-                    'source_repo_id': repo_1['id'],
-                    'override_config': {
-                        'recursive_conservative': True,
-                        'additional_repos': {repo_2['id']: repo_3['id']},
-                    },
-                    'criteria': {
-                        'filters': {
-                            'unit': {'id': MODULE_FIXTURES_ERRATA['errata_id']}
-                        },
-                        'type_ids': ['erratum'],
-                    },
+        repo_3 = self.client.post(REPOSITORY_PATH, gen_repo())
+        self._cleanup_hrefs.append(repo_3['_href'])
+
+        self.client.post(
+            f"{repo_3['_href']}actions/associate/",
+            {
+                'source_repo_id': self.repo_1['id'],
+                'override_config': {
+                    'recursive_conservative': True,
+                    'additional_repos': {self.repo_2['id']: repo_3['id']},
                 },
-            )
+                'criteria': self._ERRATA_CRITERIA,
+            },
+        )
 
-            repo_3 = self.client.get(repo_3['_href'], params={'details': True})
+        repo_3 = self.client.get(repo_3['_href'], params={'details': True})
 
-            repo_3_rpms = sorted(
-                [
-                    unit['metadata']['filename']
-                    for unit in search_units(self.cfg, repo_3, {'type_ids': ['rpm']})
-                ]
-            )
+        repo_3_rpms = [
+            unit['metadata']['filename']
+            for unit in search_units(self.cfg, repo_3, {'type_ids': ['rpm']})
+        ]
 
-            self.assertEqual(
-                repo_3_rpms, MODULE_FIXTURES_ERRATA['packages'], repo_3_rpms
-            )
+        self.assertCountEqual(repo_3_rpms, MODULE_FIXTURES_ERRATA['packages'])
 
-            self.assertEqual(
-                repo_3['content_unit_counts']['erratum'],
-                MODULE_FIXTURES_ERRATA['errata_count'],
-                repo_3['content_unit_counts'],
-            )
+        self.assertEqual(
+            repo_3['content_unit_counts']['erratum'],
+            MODULE_FIXTURES_ERRATA['errata_count'],
+            repo_3['content_unit_counts'],
+        )
 
-            self.assertEqual(
-                repo_3['content_unit_counts']['modulemd'],
-                MODULE_FIXTURES_ERRATA['modules_count'],
-                repo_3['content_unit_counts'],
-            )
+        self.assertEqual(
+            repo_3['content_unit_counts']['modulemd'],
+            MODULE_FIXTURES_ERRATA['modules_count'],
+            repo_3['content_unit_counts'],
+        )
 
-            self.assertEqual(
-                repo_3['content_unit_counts']['modulemd_defaults'],
-                MODULE_FIXTURES_ERRATA['module_defaults_count'],
-                repo_3['content_unit_counts'],
-            )
+        self.assertEqual(
+            repo_3['content_unit_counts']['modulemd_defaults'],
+            MODULE_FIXTURES_ERRATA['module_defaults_count'],
+            repo_3['content_unit_counts'],
+        )
 
-    def create_sync_repo(self, feed):
-        """Create and sync a repository given a feed."""
+    @classmethod
+    def create_repo(cls, feed):
+        """Create a repository given a feed.
+
+        The created repository is deleted by ``tearDownClass``.
+        """
         body = gen_repo(
             importer_config={'feed': feed}, distributors=[gen_distributor()]
         )
         # Using on_demand since its the default policy used by Satellite
         body['importer_config']['download_policy'] = 'on_demand'
-        repo = self.client.post(REPOSITORY_PATH, body)
-        self.addCleanup(self.client.delete, repo['_href'])
-        sync_repo(self.cfg, repo)
-        return self.client.get(repo['_href'], params={'details': True})
+        repo = cls.client.post(REPOSITORY_PATH, body)
+        cls._cleanup_hrefs.append(repo['_href'])
+        return repo
+
+    @classmethod
+    def sync_repos(cls, repos):
+        """Start a sync of every repository, then await all spawned tasks.
+
+        Submitting the syncs up front and polling their call reports
+        afterwards makes the wall time the longest sync rather than the
+        sum of them.
+        """
+        client = api.Client(cls.cfg, api.code_handler)
+        reports = [
+            client.post(f"{repo['_href']}actions/sync/", {'override_config': {}})
+            for repo in repos
+        ]
+        for report in reports:
+            tuple(api.poll_spawned_tasks(cls.cfg, report.json()))